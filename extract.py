@@ -20,9 +20,13 @@
 import sys
 import re
 import csv
+import io
 import os
+import tempfile
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Union, Any
+from typing import Any, Callable, List, Dict, Tuple, Optional, Union
 import warnings
 
 try:
@@ -55,72 +59,255 @@ try:
 except ImportError:
     HAS_PANDAS = False
 
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # 警告を抑制
 warnings.filterwarnings("ignore")
+if HAS_PYMUPDF:
+    fitz.TOOLS.mupdf_display_errors(False)
+
+# テキストクリーニング用パターン
+_UNWANTED_CHARS_RE = re.compile(r'[^\w\s。、．，：；！？「」『』（）〈〉【】○×〇▲△□■◆●・\-=]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 行の事前判定用文字集合
+# 階層パターンは行中のどこにでも一致し得るため、先頭文字ではなく
+# 「一致するには少なくとも1つ含まれるはずの文字」で判定する（数字、記号、見出し語の先頭文字）
+_HIER_CHARS = frozenset('一二三四五六七八九十０１２３４５６７８９0123456789■●▶宅権税法')
+# 問題番号パターンはすべて行頭に固定されているため先頭文字で判定できる
+_QNUM_FIRST = frozenset('問第[【０１２３４５６７８９0123456789')
+
+# 全角数字→半角数字、○→〇の変換テーブル
+_ZEN_TO_HAN = str.maketrans('０１２３４５６７８９○', '0123456789〇')
+
+# 無視行判定用パターン
+_DIGITS_ONLY_RE = re.compile(r'^\d+$')
+_SYMBOLS_ONLY_RE = re.compile(r'^[・●○〇▲△□■◆\-=\s]+$')
+_HEADER_FOOTER_RE = re.compile(r'^(ページ|Page|\d+/\d+|第\d+章)')
+_DECORATION_RE = re.compile(r'^表[①②③④⑤]')
+
+# PDFの入力元（読み込み済みのバイト列、またはファイルパス）
+PdfSource = Union[bytes, str]
+
+# 並列抽出を行う最小ページ数（これ未満はプロセス起動コストの方が大きい）
+PARALLEL_MIN_PAGES = 8
+
+# 1回のTesseract実行でOCRする最大ページ数（72dpiで1ページ約1.5MBの画像を保持する）
+OCR_BATCH_PAGES = 20
+
+
+def _extract_pages(doc: Any, opener: Callable[[PdfSource], Any],
+                   pages: Callable[[Any, int, int], List[str]],
+                   pdf_path: Path, page_count: int) -> List[str]:
+    """全ページのテキストをページ順に抽出（ページ数が多い場合はプロセス並列）
+    
+    逐次処理では呼び出し元で開いたドキュメントをそのまま使い、並列処理では
+    データを各プロセスへ転送せず、ワーカーがパスから開き直す
+    """
+    workers = min(os.cpu_count() or 1, page_count)
+    if page_count < PARALLEL_MIN_PAGES or workers <= 1:
+        return pages(doc, 0, page_count)
+    
+    chunk_size = -(-page_count // workers)  # 切り上げ
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_page_range_worker, opener, pages, str(pdf_path),
+                            start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+        page_texts = []
+        for future in futures:
+            page_texts.extend(future.result())
+    
+    return page_texts
+
+
+def _page_range_worker(opener: Callable[[PdfSource], Any],
+                       pages: Callable[[Any, int, int], List[str]],
+                       pdf_path: str, start: int, stop: int) -> List[str]:
+    """PDFをパスから開き直し、指定範囲のページテキストを抽出（プロセスワーカー）"""
+    with opener(pdf_path) as doc:
+        return pages(doc, start, stop)
+
+
+def _open_fitz(source: PdfSource) -> 'fitz.Document':
+    """PDFをPyMuPDFで開く（形式判定を省略）"""
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source, filetype="pdf")
+
+
+def _open_pdfplumber(source: PdfSource) -> 'pdfplumber.PDF':
+    """PDFをpdfplumberで開く"""
+    if isinstance(source, bytes):
+        return pdfplumber.open(io.BytesIO(source))
+    return pdfplumber.open(source)
+
+
+def _page_text(page: 'fitz.Page') -> str:
+    """ページのテキストを読み順（上→下、左→右）に並べたブロック単位で取得"""
+    # ブロック: (x0, y0, x1, y1, text, block_no, block_type)、block_type 0 がテキスト
+    blocks = page.get_text("blocks", sort=True)
+    return ''.join(block[4] for block in blocks if block[6] == 0)
+
+
+def _pymupdf_pages(doc: 'fitz.Document', start: int, stop: int) -> List[str]:
+    """PyMuPDFで指定範囲のページテキストを抽出"""
+    return [_page_text(doc[page_num]) for page_num in range(start, stop)]
+
+
+def _pdfplumber_pages(pdf: 'pdfplumber.PDF', start: int, stop: int) -> List[str]:
+    """pdfplumberで指定範囲のページテキストを抽出"""
+    return [pdf.pages[page_num].extract_text() or '' for page_num in range(start, stop)]
+
+
+def _ocr_images(images: List['Image.Image']) -> List[str]:
+    """複数の画像をマルチページTIFFにまとめ、1回のTesseract実行でOCR"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tiff_path = os.path.join(tmp_dir, 'pages.tif')
+        images[0].save(tiff_path, 'TIFF', save_all=True, append_images=images[1:])
+        text = pytesseract.image_to_string(tiff_path, lang='jpn')
+    
+    # Tesseractは各ページの後に改ページ文字（\f）を出力する
+    if text.endswith('\f'):
+        text = text[:-1]
+    page_texts = text.split('\f')
+    
+    if len(page_texts) != len(images):
+        print(f"警告: OCR結果のページ数が画像数と一致しません"
+              f"（結果: {len(page_texts)}, 画像: {len(images)}）")
+        page_texts = page_texts[:len(images)]
+        page_texts.extend([''] * (len(images) - len(page_texts)))
+    
+    return page_texts
+
+
+def _ocr_pages(doc: 'fitz.Document', start: int, stop: int) -> List[str]:
+    """指定範囲のページをテキスト抽出し、空のページのみまとめてOCR
+    
+    画像はOCR_BATCH_PAGESページごとにTesseractへ渡し、保持する画像の量を抑える
+    """
+    page_texts = []
+    ocr_indices = []
+    ocr_images = []
+    
+    def flush_ocr_batch() -> None:
+        for index, ocr_text in zip(ocr_indices, _ocr_images(ocr_images)):
+            page_texts[index] = ocr_text
+        ocr_indices.clear()
+        ocr_images.clear()
+    
+    for page_num in range(start, stop):
+        page = doc[page_num]
+        # まずテキスト抽出を試行
+        page_text = _page_text(page)
+        
+        if not page_text.strip():
+            # テキストが空の場合、OCR対象として画像化
+            # PNGを経由せず生のRGBバッファからPIL画像を作成
+            pix = page.get_pixmap(colorspace=fitz.csRGB, alpha=False)
+            ocr_indices.append(len(page_texts))
+            ocr_images.append(Image.frombytes("RGB", (pix.width, pix.height), pix.samples))
+        
+        page_texts.append(page_text)
+        
+        if len(ocr_images) >= OCR_BATCH_PAGES:
+            flush_ocr_batch()
+    
+    if ocr_images:
+        flush_ocr_batch()
+    
+    return page_texts
+
+
+# CSV列ヘッダー
+CSV_HEADERS = [
+    '大項目', '中項目', '小項目', '最小項目', '問題番号', 
+    '出題年度', '問題', '解説', '回答'
+]
+
+# 確定した問題1件分のレコード（列順はCSV_HEADERSと同じ）
+# pickle可能にするためモジュール直下で定義する
+Question = namedtuple('Question', CSV_HEADERS)
 
 
 class TakkenPDFExtractor:
     """宅建PDF抽出処理クラス"""
     
-    # CSV列ヘッダー
-    CSV_HEADERS = [
-        '大項目', '中項目', '小項目', '最小項目', '問題番号', 
-        '出題年度', '問題', '解説', '回答'
-    ]
+    CSV_HEADERS = CSV_HEADERS
+    Question = Question
     
     # 項目レベルパターン（階層構造の検出用）
     HIERARCHY_PATTERNS = {
-        '大項目': [
-            r'第[一二三四五六七八九十０-９0-9]+章\s*[：:]\s*(.+)',
-            r'[第]?[一二三四五六七八九十０-９0-9]+\s*[章編部]\s*[：:]?\s*(.+)',
-            r'宅建業法|権利関係|税・その他|法令上の制限'
-        ],
-        '中項目': [
-            r'Section\s*[０-９0-9]+\s*(.+)',
-            r'第[０-９0-9一二三四五六七八九十]+節\s*(.+)',
-            r'[０-９0-9]+[．.]\s*(.+)',
-            r'■\s*(.+)'
-        ],
-        '小項目': [
-            r'[０-９0-9一二三四五六七八九十]+[｜|]\s*(.+)',
-            r'[０-９0-9]+[-－]\s*(.+)',
-            r'●\s*(.+)'
-        ],
-        '最小項目': [
-            r'[０-９0-9]+-[０-９0-9]+\s*(.+)',
-            r'[０-９0-9]+\.\s*[０-９0-9]+\s*(.+)',
-            r'▶\s*(.+)'
-        ]
+        level: [re.compile(p, re.IGNORECASE) for p in patterns]
+        for level, patterns in {
+            '大項目': [
+                r'第[一二三四五六七八九十０-９0-9]+章\s*[：:]\s*(.+)',
+                r'[第]?[一二三四五六七八九十０-９0-9]+\s*[章編部]\s*[：:]?\s*(.+)',
+                r'宅建業法|権利関係|税・その他|法令上の制限'
+            ],
+            '中項目': [
+                r'Section\s*[０-９0-9]+\s*(.+)',
+                r'第[０-９0-9一二三四五六七八九十]+節\s*(.+)',
+                r'[０-９0-9]+[．.]\s*(.+)',
+                r'■\s*(.+)'
+            ],
+            '小項目': [
+                r'[０-９0-9一二三四五六七八九十]+[｜|]\s*(.+)',
+                r'[０-９0-9]+[-－]\s*(.+)',
+                r'●\s*(.+)'
+            ],
+            '最小項目': [
+                r'[０-９0-9]+-[０-９0-9]+\s*(.+)',
+                r'[０-９0-9]+\.\s*[０-９0-9]+\s*(.+)',
+                r'▶\s*(.+)'
+            ]
+        }.items()
     }
     
+    # 全階層パターンの結合（1回の走査で候補行を判定）
+    HIERARCHY_ANY = re.compile(
+        '|'.join(f'(?:{p.pattern})' for patterns in HIERARCHY_PATTERNS.values() for p in patterns),
+        re.IGNORECASE
+    )
+    
     # 問題番号パターン
-    QUESTION_PATTERNS = [
+    QUESTION_PATTERNS = [re.compile(p) for p in [
         r'^([０-９0-9]+)[．.。：:\s]+(.+)',
         r'^問\s*([０-９0-9]+)[．.。：:\s]*(.+)',
         r'^第?\s*([０-９0-9]+)\s*問[．.。：:\s]*(.+)',
         r'^\[([０-９0-9]+)\][．.。：:\s]*(.+)',
         r'^【([０-９0-9]+)】[．.。：:\s]*(.+)',
         r'^([０-９0-9]+)\s*[\)\）][．.。：:\s]*(.+)'
-    ]
-    
-    # 回答パターン
-    ANSWER_PATTERNS = [
-        r'^[答回正解][：:]\s*([○×〇])',
-        r'^[答回正解]\s*([○×〇])',
-        r'^([○×〇])\s*$',
-        r'答え?[：:]?\s*([○×〇])',
-        r'正解[：:]?\s*([○×〇])'
-    ]
-    
-    # 年度パターン
-    YEAR_PATTERNS = [
-        r'[Rr]([0-9０-９]+)',  # 令和
-        r'令和([0-9０-９]+)',
-        r'[Hh]([0-9０-９]+)',  # 平成
-        r'平成([0-9０-９]+)',
-        r'([0-9０-９]+)年',
-        r'20([0-9０-９]{2})'  # 西暦
-    ]
+    ]]
+    
+    # 全問題番号パターンの結合（1回の走査で候補行を判定）
+    QUESTION_ANY = re.compile('|'.join(f'(?:{p.pattern})' for p in QUESTION_PATTERNS))
+    
+    # 回答パターン（○は_clean_textで〇に正規化済み）
+    ANSWER_PATTERNS = [re.compile(p) for p in [
+        r'^[答回正解][：:]\s*([×〇])',
+        r'^[答回正解]\s*([×〇])',
+        r'^([×〇])\s*$',
+        r'答え?[：:]?\s*([×〇])',
+        r'正解[：:]?\s*([×〇])'
+    ]]
+    
+    # 年度パターン（パターン, 種別）
+    # 種別: 'R'=令和, 'H'=平成, '西暦'=20xx, '数字'=文脈で判断
+    # 数字は_clean_textで半角化済みのため半角のみを対象とする
+    YEAR_PATTERNS = [(re.compile(p), kind) for p, kind in [
+        (r'[Rr]([0-9]+)', 'R'),  # 令和
+        (r'令和([0-9]+)', 'R'),
+        (r'[Hh]([0-9]+)', 'H'),  # 平成
+        (r'平成([0-9]+)', 'H'),
+        (r'([0-9]+)年', '数字'),
+        (r'20([0-9]{2})', '西暦')  # 西暦
+    ]]
     
     def __init__(self):
         """初期化処理"""
@@ -134,8 +321,9 @@ class TakkenPDFExtractor:
         self.text_buffer = []
         self.current_question = None
         self.debug_mode = False
+        self._hier_cache: Dict[str, Optional[Tuple[str, str]]] = {}
     
-    def extract_from_pdf(self, pdf_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    def extract_from_pdf(self, pdf_path: Union[str, Path]) -> List[Question]:
         """
         PDFからテキストを抽出し、問題データを解析
         
@@ -171,11 +359,13 @@ class TakkenPDFExtractor:
     def _extract_text_from_pdf(self, pdf_path: Path) -> str:
         """PDFからテキストを抽出（フォールバック対応）"""
         text = ""
+        # ファイルは一度だけ読み込み、各抽出方法で共有する
+        pdf_data = pdf_path.read_bytes()
         
         # 1. PyMuPDFを使用（推奨）
         if HAS_PYMUPDF:
             try:
-                text = self._extract_with_pymupdf(pdf_path)
+                text = self._extract_with_pymupdf(pdf_path, pdf_data)
                 if text.strip():
                     print("PyMuPDFでテキスト抽出成功")
                     return text
@@ -185,7 +375,7 @@ class TakkenPDFExtractor:
         # 2. pdfplumberをフォールバック
         if HAS_PDFPLUMBER:
             try:
-                text = self._extract_with_pdfplumber(pdf_path)
+                text = self._extract_with_pdfplumber(pdf_path, pdf_data)
                 if text.strip():
                     print("pdfplumberでテキスト抽出成功")
                     return text
@@ -195,7 +385,7 @@ class TakkenPDFExtractor:
         # 3. OCR（最後の手段）
         if HAS_PYTESSERACT and HAS_PIL:
             try:
-                text = self._extract_with_ocr(pdf_path)
+                text = self._extract_with_ocr(pdf_path, pdf_data)
                 if text.strip():
                     print("OCRでテキスト抽出成功")
                     return text
@@ -204,92 +394,55 @@ class TakkenPDFExtractor:
         
         raise RuntimeError("すべてのテキスト抽出方法に失敗しました")
     
-    def _extract_with_pymupdf(self, pdf_path: Path) -> str:
+    def _extract_with_pymupdf(self, pdf_path: Path, pdf_data: bytes) -> str:
         """PyMuPDFを使用したテキスト抽出"""
-        doc = fitz.open(str(pdf_path))
-        text_parts = []
+        with _open_fitz(pdf_data) as doc:
+            page_texts = _extract_pages(doc, _open_fitz, _pymupdf_pages, pdf_path, doc.page_count)
         
-        try:
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                page_text = page.get_text()
-                if page_text.strip():
-                    text_parts.append(page_text)
-        finally:
-            doc.close()
-        
-        return '\n'.join(text_parts)
+        return '\n'.join(text for text in page_texts if text.strip())
     
-    def _extract_with_pdfplumber(self, pdf_path: Path) -> str:
+    def _extract_with_pdfplumber(self, pdf_path: Path, pdf_data: bytes) -> str:
         """pdfplumberを使用したテキスト抽出"""
-        text_parts = []
-        
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+        with _open_pdfplumber(pdf_data) as pdf:
+            page_texts = _extract_pages(pdf, _open_pdfplumber, _pdfplumber_pages, pdf_path, len(pdf.pages))
         
-        return '\n'.join(text_parts)
+        return '\n'.join(text for text in page_texts if text)
     
-    def _extract_with_ocr(self, pdf_path: Path) -> str:
+    def _extract_with_ocr(self, pdf_path: Path, pdf_data: bytes) -> str:
         """OCRを使用したテキスト抽出"""
         # PyMuPDFを使って画像に変換してからOCR
         if not HAS_PYMUPDF:
             raise RuntimeError("OCRにはPyMuPDFが必要です")
         
-        doc = fitz.open(str(pdf_path))
-        text_parts = []
+        with _open_fitz(pdf_data) as doc:
+            page_texts = _extract_pages(doc, _open_fitz, _ocr_pages, pdf_path, doc.page_count)
         
-        try:
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                # まずテキスト抽出を試行
-                page_text = page.get_text()
-                
-                if not page_text.strip():
-                    # テキストが空の場合、OCRを実行
-                    pix = page.get_pixmap()
-                    img_data = pix.tobytes("png")
-                    img = Image.open(io.BytesIO(img_data))
-                    ocr_text = pytesseract.image_to_string(img, lang='jpn')
-                    if ocr_text.strip():
-                        text_parts.append(ocr_text)
-                else:
-                    text_parts.append(page_text)
-        finally:
-            doc.close()
-        
-        return '\n'.join(text_parts)
+        return '\n'.join(text for text in page_texts if text.strip())
     
     def _clean_text(self, text: str) -> str:
         """テキストのクリーニング処理"""
-        # 全角数字を半角に変換
-        text = self._normalize_numbers(text)
-        
         # 不要な文字を除去
-        text = re.sub(r'[^\w\s\n\r\t。、．，：；！？「」『』（）〈〉【】○×〇▲△□■◆●・\-=]', '', text)
+        text = _UNWANTED_CHARS_RE.sub('', text)
         
         # 連続する空白文字を正規化
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
-        # 連続する改行を正規化
-        text = re.sub(r'\n\s*\n', '\n', text)
-        
-        return text.strip()
+        # 全角数字を半角に変換（縮んだ後の文字列に対して実行）
+        return self._normalize_numbers(text.strip())
     
     def _normalize_numbers(self, text: str) -> str:
-        """全角数字を半角数字に変換"""
-        zen_to_han = str.maketrans('０１２３４５６７８９', '0123456789')
-        return text.translate(zen_to_han)
+        """全角数字を半角数字に、○を〇に変換"""
+        return text.translate(_ZEN_TO_HAN)
     
     def _parse_questions(self, text: str) -> None:
         """テキストから問題データを解析"""
-        lines = text.split('\n')
+        self._hier_cache = {}
+        # 各行は一度だけstripし、以降（解説の先読みを含む）はそのまま使う
+        lines = [line.strip() for line in text.splitlines()]
         i = 0
         
         while i < len(lines):
-            line = lines[i].strip()
+            line = lines[i]
             if not line:
                 i += 1
                 continue
@@ -337,11 +490,8 @@ class TakkenPDFExtractor:
                         if explanation:
                             self.current_question['解説'] = explanation
                     else:
-                        # 問題文の続き
-                        current_text = self.current_question.get('問題', '')
-                        if current_text and not current_text.endswith('。'):
-                            current_text += ' '
-                        self.current_question['問題'] = current_text + line
+                        # 問題文の続き（結合は_finalize_current_questionで一括実行）
+                        self.current_question['_問題_parts'].append(line)
             
             i += 1
         
@@ -351,33 +501,60 @@ class TakkenPDFExtractor:
     
     def _update_hierarchy(self, line: str) -> bool:
         """階層構造を更新"""
+        if _HIER_CHARS.isdisjoint(line):
+            return False
+        
+        # 同じ行の判定結果は解析中キャッシュする（見出しや区切り行はページごとに繰り返す）
+        if line in self._hier_cache:
+            result = self._hier_cache[line]
+        else:
+            result = self._match_hierarchy(line)
+            self._hier_cache[line] = result
+        
+        if result is None:
+            return False
+        
+        level, value = result
+        self.current_hierarchy[level] = value
+        
+        # 下位レベルをクリア
+        levels = list(self.HIERARCHY_PATTERNS.keys())
+        current_index = levels.index(level)
+        for lower_level in levels[current_index + 1:]:
+            self.current_hierarchy[lower_level] = ''
+        
+        if self.debug_mode:
+            print(f"階層更新 {level}: {value}")
+        return True
+    
+    def _match_hierarchy(self, line: str) -> Optional[Tuple[str, str]]:
+        """行が該当する階層レベルと項目名を判定"""
+        # どのパターンにも該当しない行は個別パターンを試さない
+        if not self.HIERARCHY_ANY.search(line):
+            return None
+        
         for level, patterns in self.HIERARCHY_PATTERNS.items():
             for pattern in patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+                match = pattern.search(line)
                 if match:
                     if match.groups():
-                        self.current_hierarchy[level] = match.group(1).strip()
-                    else:
-                        self.current_hierarchy[level] = line.strip()
-                    
-                    # 下位レベルをクリア
-                    levels = list(self.HIERARCHY_PATTERNS.keys())
-                    current_index = levels.index(level)
-                    for lower_level in levels[current_index + 1:]:
-                        self.current_hierarchy[lower_level] = ''
-                    
-                    if self.debug_mode:
-                        print(f"階層更新 {level}: {self.current_hierarchy[level]}")
-                    return True
+                        return level, match.group(1).strip()
+                    return level, line
         
-        return False
+        return None
     
     def _detect_question_number(self, line: str) -> Optional[Tuple[str, str]]:
         """問題番号を検出"""
+        if not line or line[0] not in _QNUM_FIRST:
+            return None
+        
+        if not self.QUESTION_ANY.match(line):
+            return None
+        
         for pattern in self.QUESTION_PATTERNS:
-            match = re.match(pattern, line)
+            match = pattern.match(line)
             if match:
-                number = self._normalize_numbers(match.group(1))
+                number = match.group(1)  # _clean_textで半角化済み
                 question_text = match.group(2).strip() if len(match.groups()) > 1 else ''
                 
                 # 問題番号の妥当性チェック
@@ -392,52 +569,50 @@ class TakkenPDFExtractor:
     
     def _detect_answer(self, line: str) -> Optional[str]:
         """回答を検出"""
+        # 回答記号を含まない行（大半の行）は正規表現を使わずに除外
+        if '×' not in line and '〇' not in line:
+            return None
+        
         for pattern in self.ANSWER_PATTERNS:
-            match = re.search(pattern, line)
+            match = pattern.search(line)
             if match:
-                answer = match.group(1)
-                # 正規化
-                if answer == '○':
-                    return '〇'
-                elif answer in ['×', '〇']:
-                    return answer
+                return match.group(1)
         
         return None
     
     def _extract_year(self, line: str) -> Optional[str]:
         """出題年度を抽出"""
-        for pattern in self.YEAR_PATTERNS:
-            match = re.search(pattern, line)
+        for pattern, kind in self.YEAR_PATTERNS:
+            match = pattern.search(line)
             if match:
-                year_str = self._normalize_numbers(match.group(1))
-                try:
-                    year = int(year_str)
-                    
-                    # 令和年の判定
-                    if pattern.startswith(r'[Rr]') or '令和' in pattern:
-                        return f"R{year}"
-                    # 平成年の判定
-                    elif pattern.startswith(r'[Hh]') or '平成' in pattern:
-                        return f"H{year}"
-                    # 西暦の場合
-                    elif pattern.startswith(r'20'):
-                        # 2019年以降は令和に変換
-                        if year >= 19:
-                            return f"R{year - 18}"
-                        else:
-                            return f"H{year + 12}"  # 平成に変換
-                    # その他の数字（文脈で判断）
-                    else:
-                        if 1 <= year <= 6:  # 令和の範囲
-                            return f"R{year}"
-                        elif 1 <= year <= 31:  # 平成の範囲
-                            return f"H{year}"
-                
-                except ValueError:
-                    continue
+                year = self._format_year(kind, int(match.group(1)))
+                if year:
+                    return year
         
         return None
     
+    @staticmethod
+    def _format_year(kind: str, year: int) -> Optional[str]:
+        """年度パターンの種別と数値から出題年度表記（R/H）を生成"""
+        # 令和年の判定
+        if kind == 'R':
+            return f"R{year}"
+        # 平成年の判定
+        if kind == 'H':
+            return f"H{year}"
+        # 西暦の場合
+        if kind == '西暦':
+            # 2019年以降は令和に変換
+            if year >= 19:
+                return f"R{year - 18}"
+            return f"H{year + 12}"  # 平成に変換
+        # その他の数字（文脈で判断）
+        if 1 <= year <= 6:  # 令和の範囲
+            return f"R{year}"
+        if 1 <= year <= 31:  # 平成の範囲
+            return f"H{year}"
+        return None
+    
     def _extract_explanation(self, line: str, lines: List[str], start_index: int) -> str:
         """解説を抽出"""
         explanation_parts = []
@@ -454,7 +629,7 @@ class TakkenPDFExtractor:
         # 続きの行を読み込み
         i = start_index + 1
         while i < len(lines):
-            next_line = lines[i].strip()
+            next_line = lines[i]
             
             # 次の問題や回答が始まったら終了
             if (self._detect_question_number(next_line) or 
@@ -476,19 +651,19 @@ class TakkenPDFExtractor:
             return True
         
         # 数字のみの行
-        if re.match(r'^\d+$', line):
+        if _DIGITS_ONLY_RE.match(line):
             return True
         
         # 記号のみの行
-        if re.match(r'^[・●○▲△□■◆\-=\s]+$', line):
+        if _SYMBOLS_ONLY_RE.match(line):
             return True
         
         # ヘッダー・フッター的な行
-        if re.match(r'^(ページ|Page|\d+/\d+|第\d+章)', line):
+        if _HEADER_FOOTER_RE.match(line):
             return True
         
         # 装飾見出し（要件で無視指定）
-        if re.match(r'^表[①②③④⑤]', line):
+        if _DECORATION_RE.match(line):
             return True
         
         return False
@@ -505,9 +680,10 @@ class TakkenPDFExtractor:
             '最小項目': self.current_hierarchy['最小項目'],
             '問題番号': number,
             '出題年度': '',
-            '問題': question_text,
+            '問題': '',
             '解説': '',
-            '回答': ''
+            '回答': '',
+            '_問題_parts': [question_text]
         }
         
         if self.debug_mode:
@@ -516,6 +692,9 @@ class TakkenPDFExtractor:
     def _finalize_current_question(self) -> None:
         """現在の問題を完了し、リストに追加"""
         if self.current_question:
+            self.current_question['問題'] = self._join_question_parts(
+                self.current_question.pop('_問題_parts'))
+            
             # 必須項目のチェック
             if (self.current_question.get('問題番号') and 
                 self.current_question.get('問題')):
@@ -527,23 +706,35 @@ class TakkenPDFExtractor:
                 if not self.current_question.get('回答'):
                     self.current_question['回答'] = '×'  # デフォルト
                 
-                self.questions_data.append(self.current_question.copy())
+                self.questions_data.append(Question(**self.current_question))
                 
                 if self.debug_mode:
                     print(f"問題完了: 問{self.current_question['問題番号']}")
         
         self.current_question = None
     
+    @staticmethod
+    def _join_question_parts(parts: List[str]) -> str:
+        """問題文の断片を結合（「。」で終わらない断片の後にはスペースを挿入）"""
+        pieces = []
+        for part in parts:
+            if not part:
+                continue
+            if pieces and not pieces[-1].endswith('。'):
+                pieces.append(' ')
+            pieces.append(part)
+        return ''.join(pieces)
+    
     def save_to_csv(self, output_path: Union[str, Path]) -> None:
         """CSVファイルに保存"""
         output_path = Path(output_path)
         
         with open(output_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=self.CSV_HEADERS)
-            writer.writeheader()
-            
-            for question in self.questions_data:
-                writer.writerow(question)
+            writer = csv.writer(csvfile)
+            headers = self.CSV_HEADERS
+            writer.writerow(headers)
+            # レコードは列順のタプルなのでそのまま書き出せる
+            writer.writerows(self.questions_data)
         
         print(f"Created: {output_path}")
     
@@ -556,13 +747,30 @@ class TakkenPDFExtractor:
         output_path = Path(output_path)
         
         try:
-            df = pd.DataFrame(self.questions_data)
+            df = pd.DataFrame(self.questions_data, columns=self.CSV_HEADERS)
             df.to_excel(output_path, index=False, engine='openpyxl')
             print(f"Created: {output_path}")
         except ImportError:
             print("Warning: openpyxl未インストールのためExcel出力をスキップします")
         except Exception as e:
             print(f"Excel出力エラー: {e}")
+    
+    def to_arrow(self) -> 'pa.Table':
+        """問題データをArrowテーブルに変換"""
+        if not HAS_PYARROW:
+            raise RuntimeError("Arrow出力にはpyarrowが必要です")
+        
+        return pa.Table.from_pydict(self._columns())
+    
+    def _columns(self) -> Dict[str, List[str]]:
+        """問題データを列ごとのリストに変換"""
+        if not self.questions_data:
+            return {header: [] for header in self.CSV_HEADERS}
+        
+        return {
+            header: list(column)
+            for header, column in zip(self.CSV_HEADERS, zip(*self.questions_data))
+        }
 
 
 def main():
@@ -619,17 +827,19 @@ def main():
         
         # 統計情報の表示
         if questions:
-            correct_count = sum(1 for q in questions if q.get('回答') == '〇')
+            # 回答と大項目の組み合わせを1回の走査で集計
+            counts = Counter((q.回答, q.大項目) for q in questions)
+            
+            correct_count = sum(n for (answer, _), n in counts.items() if answer == '〇')
             incorrect_count = len(questions) - correct_count
             
             print(f"正解問題: {correct_count}")
             print(f"不正解問題: {incorrect_count}")
             
             # セクション別統計
-            sections = {}
-            for q in questions:
-                section = q.get('大項目', 'その他')
-                sections[section] = sections.get(section, 0) + 1
+            sections = Counter()
+            for (_, section), n in counts.items():
+                sections[section] += n
             
             print("\nセクション別問題数:")
             for section, count in sections.items():
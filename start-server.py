@@ -3,15 +3,109 @@ import http.server
 import socketserver
 import webbrowser
 import os
+import gzip
+import io
+import datetime
+from collections import OrderedDict
+import email.utils
+from http import HTTPStatus
 
 PORT = 8000
 
+# gzip圧縮して返す拡張子
+COMPRESSIBLE_EXTENSIONS = ('.wasm', '.js', '.html', '.css', '.json')
+
+# 圧縮済みデータを保持する最大ファイル数
+GZIP_CACHE_MAX_ENTRIES = 64
+
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    extensions_map = {
+        **http.server.SimpleHTTPRequestHandler.extensions_map,
+        '.wasm': 'application/wasm',
+    }
+
+    # 圧縮済みデータのキャッシュ（パス → (更新時刻, 圧縮データ)）、古い順に破棄
+    gzip_cache = OrderedDict()
+
+    # 圧縮対象のファイルはgzipの有無にかかわらずVaryを付ける
+    vary_accept_encoding = False
+
     def end_headers(self):
         self.send_header('Cross-Origin-Embedder-Policy', 'require-corp')
         self.send_header('Cross-Origin-Opener-Policy', 'same-origin')
+        self.send_header('Cross-Origin-Resource-Policy', 'same-origin')
+        if self.vary_accept_encoding:
+            self.send_header('Vary', 'Accept-Encoding')
         super().end_headers()
 
+    def send_head(self):
+        # GETとHEADの両方から呼ばれるため、ヘッダーは常に同じになる
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and self.path.split('?', 1)[0].endswith('/'):
+            path = os.path.join(path, 'index.html')
+
+        self.vary_accept_encoding = path.endswith(COMPRESSIBLE_EXTENSIONS) and os.path.isfile(path)
+        if not (self.vary_accept_encoding and self.accepts_gzip()):
+            return super().send_head()
+
+        mtime = os.stat(path).st_mtime
+        if self.not_modified_since(mtime):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.end_headers()
+            return None
+
+        cached = self.gzip_cache.get(path)
+        if cached and cached[0] == mtime:
+            body = cached[1]
+            self.gzip_cache.move_to_end(path)
+        else:
+            with open(path, 'rb') as f:
+                body = gzip.compress(f.read(), compresslevel=6)
+            self.gzip_cache[path] = (mtime, body)
+            self.gzip_cache.move_to_end(path)
+            if len(self.gzip_cache) > GZIP_CACHE_MAX_ENTRIES:
+                self.gzip_cache.popitem(last=False)
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Last-Modified', self.date_time_string(mtime))
+        self.end_headers()
+        return io.BytesIO(body)
+
+    def accepts_gzip(self):
+        # "gzip;q=0" は拒否として扱う
+        for coding in self.headers.get('Accept-Encoding', '').split(','):
+            name, _, params = coding.partition(';')
+            if name.strip().lower() != 'gzip':
+                continue
+            quality = 1.0
+            for param in params.split(';'):
+                key, _, value = param.strip().partition('=')
+                if key.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            return quality > 0
+        return False
+
+    def not_modified_since(self, mtime):
+        # SimpleHTTPRequestHandler.send_head と同じ判定
+        if 'If-Modified-Since' not in self.headers or 'If-None-Match' in self.headers:
+            return False
+        try:
+            ims = email.utils.parsedate_to_datetime(self.headers['If-Modified-Since'])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if ims.tzinfo is None:
+            ims = ims.replace(tzinfo=datetime.timezone.utc)
+        if ims.tzinfo is not datetime.timezone.utc:
+            return False
+        last_modified = datetime.datetime.fromtimestamp(mtime, datetime.timezone.utc)
+        return last_modified.replace(microsecond=0) <= ims
+
 if __name__ == "__main__":
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     
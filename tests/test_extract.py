@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""extract.py のテスト"""
+
+import csv
+import pickle
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import extract  # noqa: E402
+
+
+SAMPLE_LINES = [
+    '宅建業法',
+    '問1 宅地とは建物の敷地に供される土地をいう',
+    'R3',
+    '答 〇',
+    '第2問 道路は宅地に含まれる',
+    '平成28年',
+    '正解：×',
+]
+
+
+class QuestionRecordTest(unittest.TestCase):
+    """問題レコードのテスト"""
+
+    def setUp(self):
+        self.extractor = extract.TakkenPDFExtractor()
+        self.extractor._parse_questions('\n'.join(SAMPLE_LINES))
+
+    def test_records_follow_csv_headers(self):
+        self.assertEqual(len(self.extractor.questions_data), 2)
+        first = self.extractor.questions_data[0]
+        self.assertEqual(first._fields, tuple(extract.CSV_HEADERS))
+        self.assertEqual((first.問題番号, first.出題年度, first.回答), ('1', 'R3', '〇'))
+
+    def test_records_round_trip_through_pickle(self):
+        questions = self.extractor.questions_data
+        restored = pickle.loads(pickle.dumps(questions))
+        self.assertEqual(restored, questions)
+        self.assertIs(type(restored[0]), extract.Question)
+
+    def test_csv_reflects_edited_questions_data(self):
+        del self.extractor.questions_data[0]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / 'out.csv'
+            self.extractor.save_to_csv(csv_path)
+            with open(csv_path, newline='', encoding='utf-8-sig') as csvfile:
+                rows = list(csv.reader(csvfile))
+        self.assertEqual(rows[0], extract.CSV_HEADERS)
+        self.assertEqual([row[4] for row in rows[1:]], ['2'])
+
+    def test_columns_are_derived_from_questions_data(self):
+        columns = self.extractor._columns()
+        self.assertEqual(list(columns), extract.CSV_HEADERS)
+        self.assertEqual(columns['回答'], ['〇', '×'])
+        self.assertEqual(extract.TakkenPDFExtractor()._columns()['回答'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()